@@ -35,6 +35,7 @@ setup_args = dict(
         "dev": [
             "pytest",
             "pytest-clarity",
+            "pytest-xdist>=3.2",  # for --dist worksteal
             "black==23.3.0",
             "pytype==2020.11.23; python_version < '3.9'",
         ],
@@ -139,16 +139,20 @@ def _arc_to_cubic(arc: EllipticalArc) -> Iterator[Tuple[Point, Point, Point]]:
     # enough. So that we get more cubic curves than expected here. Adding 0.001f
     # reduces the count of sgements to the correct count.
     num_segments = int(ceil(fabs(arc_params.theta_arc / (PI_OVER_TWO + 0.001))))
+    end_theta = arc_params.theta1
+    sin_end_theta = sin(end_theta)
+    cos_end_theta = cos(end_theta)
     for i in range(num_segments):
-        start_theta = arc_params.theta1 + i * arc_params.theta_arc / num_segments
+        # each segment starts where the previous one ended, reuse its sin/cos
+        start_theta = end_theta
+        sin_start_theta = sin_end_theta
+        cos_start_theta = cos_end_theta
         end_theta = arc_params.theta1 + (i + 1) * arc_params.theta_arc / num_segments
 
         t = (4 / 3) * tan(0.25 * (end_theta - start_theta))
         if not isfinite(t):
             return
 
-        sin_start_theta = sin(start_theta)
-        cos_start_theta = cos(start_theta)
         sin_end_theta = sin(end_theta)
         cos_end_theta = cos(end_theta)
 
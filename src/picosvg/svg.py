@@ -89,6 +89,17 @@ _VALID_FIELDS.update(_GRADIENT_FIELDS)
 _XLINK_TEMP = "xlink_"
 
 
+# Parsers are reusable, and lxml serializes concurrent use of a single one,
+# so build it once rather than on every SVG.fromstring call
+_PARSER = etree.XMLParser(
+    remove_comments=True,
+    remove_blank_text=True,
+    # external entities may load local files (e.g. /etc/passwd), so disable
+    # safe entities like &gt; are still allowed
+    resolve_entities=False,
+)
+
+
 _ATTRIB_W_CUSTOM_INHERITANCE = frozenset({"clip-path", "opacity", "transform"})
 
 
@@ -522,7 +533,7 @@ class SVG:
                         del el.attrib["id"]
 
                 group = etree.Element(f"{{{svgns()}}}g", nsmap=self.svg_root.nsmap)
-                affine = Affine2D.identity().translate(
+                affine = Affine2D.translation(
                     float(use_el.attrib.get("x", 0)), float(use_el.attrib.get("y", 0))
                 )
 
@@ -1121,7 +1132,7 @@ class SVG:
             preserve_aspect_ratio = svg.attrib.get("preserveAspectRatio", "xMidYMid")
             transform = Affine2D.rect_to_rect(viewbox, viewport, preserve_aspect_ratio)
         else:
-            transform = Affine2D.identity().translate(x, y)
+            transform = Affine2D.translation(x, y)
 
         if "transform" in svg.attrib:
             transform = Affine2D.compose_ltr(
@@ -1430,14 +1441,7 @@ class SVG:
             string = string.replace("xlink:href", _XLINK_TEMP)
 
         # encode because fromstring dislikes xml encoding decl if input is str
-        parser = etree.XMLParser(
-            remove_comments=True,
-            remove_blank_text=True,
-            # external entities may load local files (e.g. /etc/passwd), so disable
-            # safe entities like &gt; are still allowed
-            resolve_entities=False,
-        )
-        tree = etree.fromstring(string.encode("utf-8"), parser)
+        tree = etree.fromstring(string.encode("utf-8"), _PARSER)
         tree = _fix_xlink_ns(tree)
         return cls(tree)
 
@@ -101,6 +101,9 @@ _CMD_COORDS = {
 }
 _CMD_COORDS.update({k.upper(): v for k, v in _CMD_COORDS.items()})
 
+# For each command the (x, y) arg index pairs, written comma separated
+_CMD_XY_COORDS = {k: frozenset(zip(*v)) for k, v in _CMD_COORDS.items()}
+
 
 def cmd_coords(cmd):
     if not cmd in _CMD_ARGS:
@@ -122,7 +125,7 @@ def path_segment(cmd, *args):
     args_per_cmd = check_cmd(cmd, args)
     args = [ntos(a) for a in args]
     combined_args = []
-    xy_coords = set(zip(*_CMD_COORDS[cmd]))
+    xy_coords = _CMD_XY_COORDS[cmd]
     if args_per_cmd:
         for n in range(len(args) // args_per_cmd):
             sub_args = args[n * args_per_cmd : (n + 1) * args_per_cmd]
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import lru_cache
 import re
 from typing import Generator, Tuple
 from picosvg import svg_meta
@@ -27,6 +28,8 @@ _FLOAT_RE = re.compile(
     r")"
     r"(?:[eE][-+]?[0-9]+)?"  # optional scientific notiation
 )
+# a number plus any separators before it, for splitting a whole argument list at once
+_SEP_FLOAT_RE = re.compile(f"[, ]*({_FLOAT_RE.pattern})")
 _BOOL_RE = re.compile("^[01]")
 _ARC_ARGUMENT_TYPES = (
     (float, _FLOAT_RE),  # rx
@@ -74,6 +77,15 @@ def _parse_args(cmd: str, args: str) -> Generator[float, None, None]:
         i += 1
 
 
+def _parse_float_args(cmd: str, args: str) -> Tuple[float, ...]:
+    # Every other part is a number, the rest should be empty or trailing separators
+    parts = _SEP_FLOAT_RE.split(args)
+    if any(parts[0:-1:2]) or parts[-1].strip(", "):
+        # let the general parser point out the bad argument
+        return tuple(_parse_args(cmd, args))
+    return tuple(map(float, parts[1::2]))
+
+
 def _explode_cmd(args_per_cmd, cmd, args):
     cmds = []
     for i in range(len(args) // args_per_cmd):
@@ -83,28 +95,38 @@ def _explode_cmd(args_per_cmd, cmd, args):
     return cmds
 
 
-def parse_svg_path(
-    svg_path: str, exploded: bool = False
-) -> Generator[Tuple[str, Tuple[float, ...]], None, None]:
-    """Parses an svg path.
-
-    Exploded means when params repeat each the command is reported as
-    if multiplied. For example "M1,1 2,2 3,3" would report as three
-    separate steps when exploded.
-
-    Yields tuples of (cmd, (args))."""
+@lru_cache(maxsize=1024)
+def _parse_svg_path(
+    svg_path: str, exploded: bool
+) -> Tuple[Tuple[str, Tuple[float, ...]], ...]:
+    # the result is immutable, so the same d string is only parsed once
     command_tuples = []
     parts = _CMD_RE.split(svg_path)[1:]
     for i in range(0, len(parts), 2):
         cmd = parts[i]
         raw_args = parts[i + 1].strip()
 
-        args = tuple(_parse_args(cmd, raw_args))
+        if cmd in "Aa":
+            args = tuple(_parse_args(cmd, raw_args))
+        else:
+            args = _parse_float_args(cmd, raw_args)
 
         args_per_cmd = svg_meta.check_cmd(cmd, args)
         if args_per_cmd == 0 or not exploded:
             command_tuples.append((cmd, args))
         else:
             command_tuples.extend(_explode_cmd(args_per_cmd, cmd, args))
-    for t in command_tuples:
-        yield t
+    return tuple(command_tuples)
+
+
+def parse_svg_path(
+    svg_path: str, exploded: bool = False
+) -> Generator[Tuple[str, Tuple[float, ...]], None, None]:
+    """Parses an svg path.
+
+    Exploded means when params repeat each the command is reported as
+    if multiplied. For example "M1,1 2,2 3,3" would report as three
+    separate steps when exploded.
+
+    Yields tuples of (cmd, (args))."""
+    yield from _parse_svg_path(svg_path, exploded)
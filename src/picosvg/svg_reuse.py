@@ -316,7 +316,7 @@ def affine_between(s1: SVGShape, s2: SVGShape, tolerance: float) -> Optional[Aff
     s1x, s1y = _first_move(s1)
     s2x, s2y = _first_move(s2)
 
-    affine = Affine2D.identity().translate(s2x - s1x, s2y - s1y)
+    affine = Affine2D.translation(s2x - s1x, s2y - s1y)
     if _try_affine(affine, s1, s2, tolerance, "same start point"):
         return _round(affine, s1, s2, tolerance)
 
@@ -330,12 +330,12 @@ def affine_between(s1: SVGShape, s2: SVGShape, tolerance: float) -> Optional[Aff
 
     s1_vec1 = _nth_vector(s1, s2_vec1x_idx)
 
-    s1_to_origin = Affine2D.identity().translate(-s1x, -s1y)
-    s2_to_origin = Affine2D.identity().translate(-s2x, -s2y)
+    s1_to_origin = Affine2D.translation(-s1x, -s1y)
+    s2_to_origin = Affine2D.translation(-s2x, -s2y)
     s1_vec1_to_s2_vec1x = _affine_vec2vec(s1_vec1, s2_vec1x)
 
     # Move to s2 start
-    origin_to_s2 = Affine2D.identity().translate(s2x, s2y)
+    origin_to_s2 = Affine2D.translation(s2x, s2y)
 
     affine = Affine2D.compose_ltr((s1_to_origin, s1_vec1_to_s2_vec1x, origin_to_s2))
     if _try_affine(affine, s1, s2, tolerance, "align vec1x"):
@@ -17,7 +17,7 @@
 Focuses on converting to a sequence of affine matrices.
 """
 import collections
-from functools import reduce
+from functools import lru_cache, reduce
 from math import cos, sin, radians, tan, hypot
 import operator
 import re
@@ -70,12 +70,17 @@ class Affine2D(NamedTuple):
     def degenerate():
         return Affine2D._degnerate
 
+    @classmethod
+    def translation(cls, tx, ty=0) -> "Affine2D":
+        """Return a pure translation; same as identity().translate(tx, ty)."""
+        return cls(1, 0, 0, 1, tx, ty)
+
     @staticmethod
     def fromstring(raw_transform):
         return parse_svg_transform(raw_transform)
 
     def tostring(self):
-        if self == Affine2D.identity().translate(*self.gettranslate()):
+        if self == Affine2D.translation(*self.gettranslate()):
             return f'translate({", ".join(ntos(v) for v in self.gettranslate())})'
         return f'matrix({" ".join(ntos(v) for v in self)})'
 
@@ -100,13 +105,21 @@ class Affine2D(NamedTuple):
         """
         if not isinstance(other, Affine2D):
             return NotImplemented
+        # folds (compose_ltr, parse_svg_transform) start from identity
+        if self == Affine2D._identity:
+            return other
+        if other == Affine2D._identity:
+            return self
+        # unpacking once is much cheaper than 16 field lookups, as are positional args
+        a1, b1, c1, d1, e1, f1 = self
+        a2, b2, c2, d2, e2, f2 = other
         return Affine2D(
-            a=self.a * other.a + self.c * other.b,  # + self.e * 0
-            b=self.b * other.a + self.d * other.b,  # + self.f * 0
-            c=self.a * other.c + self.c * other.d,  # + self.e * 0
-            d=self.b * other.c + self.d * other.d,  # + self.f * 0
-            e=self.a * other.e + self.c * other.f + self.e,  # * 1
-            f=self.b * other.e + self.d * other.f + self.f,  # * 1
+            a1 * a2 + c1 * b2,  # a, + e1 * 0
+            b1 * a2 + d1 * b2,  # b, + f1 * 0
+            a1 * c2 + c1 * d2,  # c, + e1 * 0
+            b1 * c2 + d1 * d2,  # d, + f1 * 0
+            a1 * e2 + c1 * f2 + e1,  # e, e1 * 1
+            b1 * e2 + d1 * f2 + f1,  # f, f1 * 1
         )
 
     __imatmul__ = __matmul__
@@ -135,9 +148,10 @@ class Affine2D(NamedTuple):
     # https://www.w3.org/TR/SVG11/coords.html#RotationDefined
     # Note that rotation here is in radians
     def rotate(self, a, cx=0.0, cy=0.0):
+        cos_a, sin_a = cos(a), sin(a)
         return (
             self.translate(cx, cy)
-            .matrix(cos(a), sin(a), -sin(a), cos(a), 0, 0)
+            .matrix(cos_a, sin_a, -sin_a, cos_a, 0, 0)
             .translate(-cx, -cy)
         )
 
@@ -166,10 +180,11 @@ class Affine2D(NamedTuple):
         The inverse of a degenerate Affine2D is itself degenerate."""
         if self == self.identity():
             return self
-        elif self.is_degenerate():
-            return Affine2D.degenerate()
         a, b, c, d, e, f = self
-        det = self.determinant()
+        # same test as is_degenerate, without computing the determinant twice
+        det = a * d - b * c
+        if abs(det) <= float_info.epsilon:
+            return Affine2D.degenerate()
         a, b, c, d = d / det, -b / det, -c / det, a / det
         e, f = -a * e - c * f, -b * e - d * f
         return self.__class__(a, b, c, d, e, f)
@@ -177,12 +192,15 @@ class Affine2D(NamedTuple):
     def map_point(self, pt: Tuple[float, float]) -> Point:
         """Return Point (x, y) multiplied by Affine2D."""
         x, y = pt
-        return Point(self.a * x + self.c * y + self.e, self.b * x + self.d * y + self.f)
+        a, b, c, d, e, f = self
+        # _make skips the keyword-aware NamedTuple __new__
+        return Point._make((a * x + c * y + e, b * x + d * y + f))
 
     def map_vector(self, vec: Tuple[float, float]) -> Vector:
         """Return Vector (x, y) multiplied by Affine2D, treating translation as zero."""
         x, y = vec
-        return Vector(self.a * x + self.c * y, self.b * x + self.d * y)
+        a, b, c, d, _, _ = self
+        return Vector._make((a * x + c * y, b * x + d * y))
 
     @classmethod
     def compose_ltr(cls, affines: Sequence["Affine2D"]) -> "Affine2D":
@@ -265,7 +283,8 @@ class Affine2D(NamedTuple):
     def almost_equals(
         self, other: "Affine2D", tolerance=DEFAULT_ALMOST_EQUAL_TOLERANCE
     ):
-        return all(almost_equal(v1, v2, tolerance) for v1, v2 in zip(self, other))
+        # almost_equal inlined; all() stops at the first mismatch and rejects NaN
+        return all(abs(v1 - v2) <= tolerance for v1, v2 in zip(self, other))
 
     def decompose_scale(self) -> Tuple["Affine2D", "Affine2D"]:
         """Split affine into a scale component and whatever remains.
@@ -334,7 +353,7 @@ class Affine2D(NamedTuple):
         # basically this says "by how much do I need to pre-translate things so
         # that when I subsequently apply the 2x2 portion of the original affine
         # (with the translation zeroed) it'll land me in the same place?"
-        translation = Affine2D.identity().translate(x_prime, y_prime)
+        translation = Affine2D.translation(x_prime, y_prime)
         # sanity check that combining the two affines gives back self
         test_compose = Affine2D.compose_ltr((translation, affine_prime))
         assert self.almost_equals(
@@ -348,21 +367,63 @@ Affine2D._degnerate = Affine2D(0, 0, 0, 0, 0, 0)
 Affine2D._flip_y = Affine2D(1, 0, 0, -1, 0, 0)
 
 
+_TRANSFORM_RE = re.compile(
+    r"(matrix|translate|scale|rotate|skewX|skewY)\s*\(([^)]*)\)", re.IGNORECASE
+)
+
+
 def _fix_rotate(args):
     args[0] = radians(args[0])
 
 
+def _merge_translate(args1, args2):
+    # translate(tx [ty]), ty defaults to 0
+    # leave wrong arg counts unmerged, the Affine2D method will reject them
+    if not (1 <= len(args1) <= 2 and 1 <= len(args2) <= 2):
+        return None
+    tx1, ty1 = (args1 + [0])[:2]
+    tx2, ty2 = (args2 + [0])[:2]
+    return [tx1 + tx2, ty1 + ty2]
+
+
+def _merge_scale(args1, args2):
+    # scale(sx [sy]), sy defaults to sx
+    # leave wrong arg counts unmerged, the Affine2D method will reject them
+    if not (1 <= len(args1) <= 2 and 1 <= len(args2) <= 2):
+        return None
+    sx1, sy1 = (args1 * 2)[:2]
+    sx2, sy2 = (args2 * 2)[:2]
+    return [sx1 * sx2, sy1 * sy2]
+
+
+# adjacent transforms of these kinds combine into one, saving a matrix product
+_SVG_ARG_MERGES = {
+    "translate": _merge_translate,
+    "scale": _merge_scale,
+}
+
+
+# Affine2D is immutable and documents tend to repeat the same transform attributes
+@lru_cache(maxsize=1024)
 def parse_svg_transform(raw_transform: str):
     # much simpler to read if we do stages rather than a single regex
     # one day it might be worth writing a real parser
-    transform = Affine2D.identity()
-
-    for match in re.finditer(
-        r"(?i)(matrix|translate|scale|rotate|skewX|skewY)\s*\(([^)]*)\)", raw_transform
-    ):
+    ops = []
+    for match in _TRANSFORM_RE.finditer(raw_transform):
         op = match.group(1).lower()
-        args = [float(p) for p in re.split(r"\s*[,\s]\s*", match.group(2).strip())]
+        args = [float(p) for p in match.group(2).replace(",", " ").split()]
+        if not args:
+            raise ValueError(f"Missing arguments for {op}")
         _SVG_ARG_FIXUPS[op](args)
+        if ops and ops[-1][0] == op and op in _SVG_ARG_MERGES:
+            merged_args = _SVG_ARG_MERGES[op](ops[-1][1], args)
+            if merged_args is not None:
+                ops[-1] = (op, merged_args)
+                continue
+        ops.append((op, args))
+
+    transform = Affine2D.identity()
+    for op, args in ops:
         transform = getattr(transform, op)(*args)
 
     return transform
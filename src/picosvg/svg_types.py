@@ -14,6 +14,7 @@
 
 import copy
 import dataclasses
+from functools import lru_cache
 from itertools import zip_longest
 import math
 import numbers
@@ -52,6 +53,23 @@ def _round_multiple(f: float, of: float) -> float:
     return round(f / of) * of
 
 
+@lru_cache(maxsize=1024)
+def _path_bounding_box(d: str) -> Rect:
+    # keyed by path data, so mutating a shape can't leave a stale box behind
+    x1, y1, x2, y2 = svg_pathops.bounding_box(SVGPath(d=d).as_cmd_seq())
+    return Rect(x1, y1, x2 - x1, y2 - y1)
+
+
+@lru_cache(maxsize=None)
+def _attr_types(shape_type) -> Mapping[str, type]:
+    # dataclass fields are fixed per class, no need to rebuild this for every style
+    return {f.name.replace("_", "-"): f.type for f in dataclasses.fields(shape_type)}
+
+
+# https://www.w3.org/TR/SVG11/paths.html#PathDataCurveCommands
+_SHORTHAND_TO_LONG = {"S": "C", "T": "Q"}
+
+
 def _explicit_lines_callback(subpath_start, curr_pos, cmd, args, *_):
     del subpath_start
     if cmd == "v":
@@ -238,23 +256,28 @@ class SVGShape:
         def _visible(fill, opacity):
             return fill != "none" and shape.opacity * opacity != 0
 
+        stroke_visible = (
+            _visible(shape.stroke, shape.stroke_opacity) and shape.stroke_width != 0
+        )
+        fill_visible = _visible(shape.fill, shape.fill_opacity)
+
+        # Neither stroke nor fill; no need to look at the path at all
+        if not (stroke_visible or fill_visible):
+            return False
+
+        cmd_seq = shape.as_cmd_seq()
+
         # if all you do is move the pen around you can't draw
-        if all(c[0].upper() == "M" for c in self.as_cmd_seq()):
+        if all(c[0].upper() == "M" for c in cmd_seq):
             return False
 
         # Does it look like the stroke is visible?
-        if _visible(shape.stroke, shape.stroke_opacity) and shape.stroke_width != 0:
+        if stroke_visible:
             return True
 
-        # No stroke; if the shape is hidden we can't draw
-        if not _visible(shape.fill, shape.fill_opacity):
-            return False
-
         # Only shapes with area paint
         try:
-            return (
-                svg_pathops.path_area(shape.as_cmd_seq(), fill_rule=shape.fill_rule) > 0
-            )
+            return svg_pathops.path_area(cmd_seq, fill_rule=shape.fill_rule) > 0
         except svg_pathops.pathops.PathOpsError:
             # some tricky paths with very densely packed segments sometimes can trigger a
             # PathOpsError. We assume they do paint to stay on the safe side.
@@ -262,8 +285,7 @@ class SVGShape:
             return True
 
     def bounding_box(self) -> Rect:
-        x1, y1, x2, y2 = svg_pathops.bounding_box(self.as_cmd_seq())
-        return Rect(x1, y1, x2 - x1, y2 - y1)
+        return _path_bounding_box(self.as_path().d)
 
     def apply_transform(self, transform: Affine2D) -> "SVGPath":
         target = self.as_path()
@@ -278,13 +300,19 @@ class SVGShape:
         raise NotImplementedError("You should implement as_path")
 
     def as_cmd_seq(self) -> SVGCommandSeq:
-        return (
-            self.as_path()
-            .explicit_lines()  # hHvV => lL
-            .expand_shorthand(inplace=True)
-            .absolute(inplace=True)
-            .arcs_to_cubics(inplace=True)
-        )
+        target = self.as_path()
+        if target is self:
+            target = copy.deepcopy(target)
+        # every step is a full walk of the path, skip those with nothing to rewrite
+        cmds = {cmd.upper() for cmd, _ in target}
+        if not cmds.isdisjoint("HV"):
+            target.explicit_lines(inplace=True)  # hHvV => lL
+        if not cmds.isdisjoint("ST"):
+            target.expand_shorthand(inplace=True)
+        target.absolute(inplace=True)
+        if "A" in cmds:
+            target.arcs_to_cubics(inplace=True)
+        return target
 
     def absolute(self, inplace=False) -> "SVGShape":
         """Returns equivalent path with only absolute commands."""
@@ -324,9 +352,7 @@ class SVGShape:
         if not inplace:
             target = copy.deepcopy(self)
         if target.style:
-            attr_types = {
-                f.name.replace("_", "-"): f.type for f in dataclasses.fields(self)
-            }
+            attr_types = _attr_types(type(self))
             raw_attrs = {}
             unparsed_style = parse_css_declarations(
                 target.style, raw_attrs, property_names=attr_types.keys()
@@ -542,25 +568,25 @@ class SVGPath(SVGShape, SVGCommandSeq):
     def move(self, dx, dy, inplace=False):
         """Returns a new path that is this one shifted."""
 
-        def move_callback(subpath_start, curr_pos, cmd, args, *_unused):
-            del subpath_start
-            del curr_pos
-            # Paths must start with an absolute moveto. Relative bits are ... relative.
-            # Shift the absolute parts and call it a day.
-            if cmd.islower():
-                return ((cmd, args),)
-            x_coord_idxs, y_coord_idxs = cmd_coords(cmd)
-            args = list(args)  # we'd like to mutate 'em
-            for x_coord_idx in x_coord_idxs:
-                args[x_coord_idx] += dx
-            for y_coord_idx in y_coord_idxs:
-                args[y_coord_idx] += dy
-            return ((cmd, args),)
-
         target = self
         if not inplace:
             target = copy.deepcopy(self)
-        target.walk(move_callback)
+
+        # Shifting needs no pen position, so skip walk() and its bookkeeping
+        d, target.d = target.d, ""
+        for idx, (cmd, args) in enumerate(parse_svg_path(d, exploded=True)):
+            # Paths must start with an absolute moveto. Relative bits are ... relative.
+            # Shift the absolute parts and call it a day.
+            if idx == 0 and cmd == "m":
+                cmd = "M"
+            if cmd.isupper():
+                x_coord_idxs, y_coord_idxs = cmd_coords(cmd)
+                args = list(args)  # we'd like to mutate 'em
+                for x_coord_idx in x_coord_idxs:
+                    args[x_coord_idx] += dx
+                for y_coord_idx in y_coord_idxs:
+                    args[y_coord_idx] += dy
+            target._add_cmd(cmd, *args)
         return target
 
     def _rewrite_path(self, rewrite_fn, inplace) -> "SVGPath":
@@ -617,8 +643,8 @@ class SVGPath(SVGShape, SVGCommandSeq):
         def expand_shorthand_callback(
             _, curr_pos, cmd, args, prev_pos, prev_cmd, prev_args
         ):
-            short_to_long = {"S": "C", "T": "Q"}
-            if not cmd.upper() in short_to_long:
+            long_cmd = _SHORTHAND_TO_LONG.get(cmd.upper())
+            if long_cmd is None:
                 return ((cmd, args),)
 
             if cmd.islower():
@@ -631,12 +657,13 @@ class SVGPath(SVGShape, SVGCommandSeq):
                     prev_cmd, prev_args = _relative_to_absolute(
                         prev_pos, prev_cmd, prev_args
                     )
-                if prev_cmd in short_to_long.values():
+                # S only reflects a cubic, T only a quadratic
+                if prev_cmd == long_cmd:
                     # reflect 2nd-last x,y pair over curr_pos and make it our first arg
                     prev_cp = Point(prev_args[-4], prev_args[-3])
                     new_cp = (2 * curr_pos.x - prev_cp.x, 2 * curr_pos.y - prev_cp.y)
 
-            return ((short_to_long[cmd], new_cp + args),)
+            return ((long_cmd, new_cp + args),)
 
         target = self
         if not inplace:
@@ -719,7 +746,15 @@ class SVGPath(SVGShape, SVGCommandSeq):
 
         d, target.d = target.d, ""
         for cmd, args in parse_svg_path(d):
-            target._add_cmd(cmd, *(_round_multiple(n, multiple_of) for n in args))
+            if cmd in "Aa":
+                # large-arc and sweep flags are 0 or 1, not coordinates
+                args = (
+                    n if i % 7 in (3, 4) else _round_multiple(n, multiple_of)
+                    for i, n in enumerate(args)
+                )
+            else:
+                args = (_round_multiple(n, multiple_of) for n in args)
+            target._add_cmd(cmd, *args)
 
         return target
 
@@ -54,3 +54,15 @@ import pytest
 )
 def test_parse_svg_path(d, expected):
     assert tuple(parse_svg_path(d, exploded=False)) == expected
+
+
+@pytest.mark.parametrize(
+    "d, match",
+    [
+        ("M0,0 1x", r"Invalid argument #3 for 'M': 'x'"),
+        ("L1 2 3 4..5", r"Invalid argument #4 for 'L': '..5'"),
+    ],
+)
+def test_parse_svg_path_invalid(d, match):
+    with pytest.raises(ValueError, match=match):
+        tuple(parse_svg_path(d))
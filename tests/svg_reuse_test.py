@@ -34,6 +34,7 @@ import pytest
         # https://github.com/googlefonts/picosvg/issues/249
         (SVGPath(d="M-1,-1 L 0,1 L 1, -1 z"), 0.1, "M0,0 l1,0 l-0.6,1 z"),
     ],
+    ids=["noto_eyes", "issue_249"],
 )
 def test_svg_normalization(shape, tolerance, expected_normalization):
     normalized = normalize(shape, tolerance)
@@ -110,6 +111,7 @@ def test_svg_normalization(shape, tolerance, expected_normalization):
             ),
         ),
     ],
+    ids=["box", "arc_flat_y", "arc_flat_x", "noto_arc_sqrt", "openmoji_1f5fe"],
 )
 def test_vectors_for_path(path, expected_vectors):
     assert (
@@ -140,7 +142,7 @@ def test_vectors_for_path(path, expected_vectors):
         (
             SVGRect(x=0, y=1, width=1, height=1),
             SVGRect(x=1, y=0, width=1, height=1),
-            Affine2D.identity().translate(1, -1),
+            Affine2D.translation(1, -1),
             0.01,
         ),
         # different rects
@@ -154,7 +156,7 @@ def test_vectors_for_path(path, expected_vectors):
         (
             SVGCircle(cx=15.89, cy=64.13, r=4),
             SVGCircle(cx=64.89, cy=16.13, r=4),
-            Affine2D.identity().translate(49, -48),
+            Affine2D.translation(49, -48),
             0.01,
         ),
         # path observed in wild to normalize but not compute affine_between
@@ -166,7 +168,7 @@ def test_vectors_for_path(path, expected_vectors):
             SVGPath(
                 fill="#99AAB5", d="M34 12H18c-1.104 0-2 .896-2 2h20c0-1.104-.896-2-2-2z"
             ),
-            Affine2D.identity().translate(16, 0),
+            Affine2D.translation(16, 0),
             0.01,
         ),
         # Triangles facing one another, same size
@@ -218,7 +220,7 @@ def test_vectors_for_path(path, expected_vectors):
             SVGPath(
                 d="M83,45.94   L83,45.94    c-4.19,0-8,3.54-8,9.42 s3.81,9.41,8,9.41l0,0 c4.19,0,8-3.54,8-9.41 S87.21,45.94,83,45.94z"
             ),
-            Affine2D.identity().translate(38.33, 0.0),
+            Affine2D.translation(38.33, 0.0),
             0.1,
         ),
         # https://github.com/googlefonts/picosvg/issues/266 circles become arcs and don't normalize well
@@ -268,25 +270,49 @@ def test_vectors_for_path(path, expected_vectors):
             0.01,
         ),
     ],
+    ids=[
+        "rect_vs_circle",
+        "same_rect",
+        "same_rect_same_id",
+        "rect_offset",
+        "different_rects",
+        "noto_clock_circles",
+        "equivalent_d_attrs",
+        "triangles_facing",
+        "triangles_rotated_scaled",
+        "square_vs_rect",
+        "squares_flipped_y",
+        "noto_issue_138",
+        "noto_eyes",
+        "circles_issue_266",
+        "rects_become_one",
+        "arcs_taller",
+        "arcs_issue_271_ex1",
+        "arcs_issue_271_ex2",
+    ],
 )
 def test_svg_reuse(s1, s2, expected_affine, tolerance):
-    # if we can get an affine we should normalize to same shape
-    if expected_affine:
-        assert (
-            normalize(s1, tolerance).d == normalize(s2, tolerance).d
-        ), "should have normalized the same"
-    else:
+    if not expected_affine:
         assert (
             normalize(s1, tolerance).d != normalize(s2, tolerance).d
         ), "should NOT have normalized the same"
+        assert (
+            affine_between(s1, s2, tolerance) is None
+        ), f"Unexpected affine found between {s1.as_path().d} and {s2.as_path().d}."
+        return
+
+    # if we can get an affine we should normalize to same shape
+    assert (
+        normalize(s1, tolerance).d == normalize(s2, tolerance).d
+    ), "should have normalized the same"
 
     affine = affine_between(s1, s2, tolerance)
-    if expected_affine:
-        assert (
-            affine
-        ), f"No affine found between {s1.as_path().d} and {s2.as_path().d}. Expected {expected_affine}"
-        # Round because we've seen issues with different test environments when overly fine
-        affine = affine.round(4)
     assert (
-        affine == expected_affine
-    ), f"Unexpected affine found between {s1.as_path().d} and {s2.as_path().d}."
+        affine
+    ), f"No affine found between {s1.as_path().d} and {s2.as_path().d}. Expected {expected_affine}"
+    # Expected values are given to 4 decimal places; compare with a tolerance
+    # rather than exactly, we've seen issues with different test environments
+    # when overly fine
+    assert affine.almost_equals(
+        expected_affine, 1e-4
+    ), f"Unexpected affine {affine} found between {s1.as_path().d} and {s2.as_path().d}."
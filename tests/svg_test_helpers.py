@@ -12,32 +12,51 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 from lxml import etree
 import os
 from picosvg.svg import SVG
 
 
+@functools.lru_cache(maxsize=None)
 def locate_test_file(filename):
     return os.path.join(os.path.dirname(__file__), filename)
 
 
+@functools.lru_cache(maxsize=None)
+def _read_test_file(path):
+    # test files are read-only, cache the text and parse a fresh SVG every time
+    with open(path) as f:
+        return f.read()
+
+
 def load_test_svg(filename):
-    return SVG.parse(locate_test_file(filename))
+    return SVG.fromstring(_read_test_file(locate_test_file(filename)))
 
 
 def svg_string(*els):
-    root = etree.fromstring(
-        '<svg version="1.1" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 128 128"/>'
+    # plain text; SVG.fromstring parses it once, no need to build a tree here
+    return (
+        '<svg version="1.1" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 128 128">'
+        + "".join(els)
+        + "</svg>"
     )
-    for el in els:
-        root.append(etree.fromstring(el))
-    return etree.tostring(root)
+
+
+def svg_string_params(params):
+    # wrap the leading fragment of each parametrize case once, at collection time
+    return [(svg_string(el), *rest) for el, *rest in params]
 
 
 def svg(*els):
     return SVG.fromstring(svg_string(*els))
 
 
+def svg_params(params):
+    # like svg_string_params but parsed; tests that modify inplace must clone
+    return [(svg(el), *rest) for el, *rest in params]
+
+
 def pretty_print(svg_tree):
     def _reduce_text(text):
         text = text.strip() if text else None
@@ -49,12 +68,3 @@ def pretty_print(svg_tree):
         e.tail = _reduce_text(e.tail)
 
     return etree.tostring(svg_tree, pretty_print=True).decode("utf-8")
-
-
-def drop_whitespace(svg):
-    svg._update_etree()
-    for el in svg.svg_root.iter("*"):
-        if el.text is not None:
-            el.text = el.text.strip()
-        if el.tail is not None:
-            el.tail = el.tail.strip()
@@ -64,16 +64,38 @@ from typing import Tuple
             "matrix( -1,0,0,1,3717.75,0 )",
             Affine2D(-1, 0, 0, 1, 3717.75, 0),
         ),
+        # adjacent translates and scales merge, each with its own defaults
+        (
+            "translate(2) translate(3, 4) scale(2) scale(3, 5)",
+            Affine2D(6, 0, 0, 10, 5, 4),
+        ),
     ],
 )
 def test_parse_svg_transform(transform: str, expected_result: Tuple[str, ...]):
     actual = parse_svg_transform(transform)
-    print(f"A: {actual}")
-    print(f"E: {expected_result}")
-
     assert actual == pytest.approx(expected_result, rel=1e-3)
 
 
+@pytest.mark.parametrize(
+    "transform, error",
+    [
+        ("translate()", ValueError),
+        ("translate(1) translate()", ValueError),
+        ("translate() translate(1)", ValueError),
+        ("scale(2) scale()", ValueError),
+        ("rotate()", ValueError),
+        ("matrix()", ValueError),
+        ("matrix( , )", ValueError),
+        ("translate(1 2 3) translate(1)", TypeError),
+        ("scale(1 2 3) scale(2)", TypeError),
+    ],
+)
+def test_parse_svg_transform_bad_arg_count(transform: str, error):
+    # adjacent ops are merged, that mustn't change how bad args are reported
+    with pytest.raises(error):
+        parse_svg_transform(transform)
+
+
 class TestAffine2D:
     def test_map_point(self):
         t = Affine2D(2, 0, 0, 1, 10, 20)
@@ -286,11 +308,17 @@ class TestAffine2D:
 
     def test_product(self):
         affine1 = Affine2D.identity().rotate(pi / 2)
-        affine2 = Affine2D.identity().translate(1, 1)
+        affine2 = Affine2D.translation(1, 1)
         p0 = Point(1, 1)
         expected = affine2.map_point(affine1.map_point(p0)).round(2)
         assert (affine2 @ affine1).map_point(p0).round(2) == expected
 
+    def test_product_identity(self):
+        affine = Affine2D(2, 0.5, -1, 3, 4, 5)
+        assert Affine2D.identity() @ affine is affine
+        assert affine @ Affine2D.identity() is affine
+        assert affine @ Affine2D(1.0, 0.0, 0.0, 1.0, 0.0, 0.0) is affine
+
     def test_product_ordering(self):
         affine1 = Affine2D.identity().rotate(pi / 2)
         affine2 = Affine2D.identity().rotate(pi / 2, cx=0, cy=1)
@@ -312,6 +340,11 @@ class TestAffine2D:
         af = af.translate(2, 3).rotate(pi / 2)
         assert af.gettranslate() == (3, 5)
 
+    def test_translation(self):
+        assert Affine2D.translation(3, -4) == Affine2D.identity().translate(3, -4)
+        assert Affine2D.translation(5) == Affine2D(1, 0, 0, 1, 5, 0)
+        assert Affine2D.translation(0, 0) == Affine2D.identity()
+
     def test_getscale(self):
         af = Affine2D.identity()
         assert af.getscale() == (1, 1)
@@ -326,6 +359,14 @@ class TestAffine2D:
         assert a1.almost_equals(a2, tolerance=1e-03)
         assert not a1.almost_equals(a2, tolerance=1e-04)
 
+        # NaN is never almost equal to anything, whichever component it's in
+        nan = float("nan")
+        assert not Affine2D(1, 0, 0, 1, nan, 0).almost_equals(
+            Affine2D(1, 0, 0, 1, 5, 0)
+        )
+        assert not Affine2D(nan, 0, 0, 1, 0, 0).almost_equals(Affine2D.identity())
+        assert not Affine2D.identity().almost_equals(Affine2D(1, 0, 0, 1, 0, nan))
+
     @pytest.mark.parametrize(
         "affine, expected_scale, expected_remaining",
         [
@@ -70,9 +70,7 @@ from svg_test_helpers import *
 )
 def test_path_absolute(path: str, expected_result: str):
     actual = SVGPath(d=path).absolute(inplace=True).round_floats(3, inplace=True).d
-    print(f"A: {actual}")
-    print(f"E: {expected_result}")
-    assert actual == expected_result
+    assert actual == expected_result, f"A: {actual}\nE: {expected_result}"
 
 
 @pytest.mark.parametrize(
@@ -88,9 +86,7 @@ def test_path_absolute_moveto(path: str, expected_result: str):
     actual = (
         SVGPath(d=path).absolute_moveto(inplace=True).round_floats(3, inplace=True).d
     )
-    print(f"A: {actual}")
-    print(f"E: {expected_result}")
-    assert actual == expected_result
+    assert actual == expected_result, f"A: {actual}\nE: {expected_result}"
 
 
 @pytest.mark.parametrize(
@@ -116,9 +112,7 @@ def test_path_absolute_moveto(path: str, expected_result: str):
 )
 def test_path_move(path: str, move, expected_result: str):
     actual = SVGPath(d=path).move(*move, inplace=True).d
-    print(f"A: {actual}")
-    print(f"E: {expected_result}")
-    assert actual == expected_result
+    assert actual == expected_result, f"A: {actual}\nE: {expected_result}"
 
 
 @pytest.mark.parametrize(
@@ -138,6 +132,8 @@ def test_path_move(path: str, move, expected_result: str):
         ("S875,900 900,800", "C0,0 875,900 900,800"),
         # T without preceding Q
         ("M16,12 T16,20", "M16,12 Q16,12 16,20"),
+        # S after Q doesn't reflect the quadratic control point
+        ("M0,0 Q10,10 20,0 S30,10 40,0", "M0,0 Q10,10 20,0 C20,0 30,10 40,0"),
         # C/s
         (
             "M600,800 C625,700 725,700 750,800 s55,55 200,100",
@@ -154,26 +150,24 @@ def test_expand_shorthand(path, expected_result):
     actual = (
         SVGPath(d=path).expand_shorthand(inplace=True).round_floats(3, inplace=True).d
     )
-    print(f"A: {actual}")
-    print(f"E: {expected_result}")
-    assert actual == expected_result
+    assert actual == expected_result, f"A: {actual}\nE: {expected_result}"
 
 
 @pytest.mark.parametrize(
-    "shape, expected_bbox",
-    [
-        # plain rect
-        ('<rect x="2" y="2" width="6" height="2" />', Rect(2, 2, 6, 2)),
-        # triangle
-        ('<path d="m5,2 2.5,5 -5,0 z" />', Rect(2.5, 2, 5, 5)),
-    ],
+    "nsvg, expected_bbox",
+    svg_params(
+        [
+            # plain rect
+            ('<rect x="2" y="2" width="6" height="2" />', Rect(2, 2, 6, 2)),
+            # triangle
+            ('<path d="m5,2 2.5,5 -5,0 z" />', Rect(2.5, 2, 5, 5)),
+        ]
+    ),
 )
-def test_bounding_box(shape, expected_bbox):
-    nsvg = svg(shape)
+def test_bounding_box(nsvg, expected_bbox):
+    # bounding_box doesn't modify the tree, safe to share the parsed svg
     actual_bbox = nsvg.shapes()[0].bounding_box()
-    print(f"A: {actual_bbox}")
-    print(f"E: {expected_bbox}")
-    assert actual_bbox == expected_bbox
+    assert actual_bbox == expected_bbox, f"A: {actual_bbox}\nE: {expected_bbox}"
 
 
 @pytest.mark.parametrize(
@@ -202,9 +196,7 @@ def test_arcs_to_cubics(path, expected_result):
     actual = (
         SVGPath(d=path).arcs_to_cubics(inplace=True).round_floats(3, inplace=True).d
     )
-    print(f"A: {actual}")
-    print(f"E: {expected_result}")
-    assert actual == expected_result
+    assert actual == expected_result, f"A: {actual}\nE: {expected_result}"
 
 
 @pytest.mark.parametrize(
@@ -213,7 +205,7 @@ def test_arcs_to_cubics(path, expected_result):
         # translate
         (
             "M1,1 L2,1 L2,2 L1,2 Z",
-            Affine2D.identity().translate(2, 1),
+            Affine2D.translation(2, 1),
             "M3,2 L4,2 L4,3 L3,3 Z",
         ),
         # same shape as above under a degenerate transform
@@ -222,9 +214,7 @@ def test_arcs_to_cubics(path, expected_result):
 )
 def test_apply_basic_transform(path, transform, expected_result):
     actual = SVGPath(d=path).apply_transform(transform).round_floats(3).d
-    print(f"A: {actual}")
-    print(f"E: {expected_result}")
-    assert actual == expected_result
+    assert actual == expected_result, f"A: {actual}\nE: {expected_result}"
 
 
 @pytest.mark.parametrize(
@@ -290,13 +280,13 @@ def test_apply_style_attribute(shape, expected):
         ("m1,1 2,0 1,3", 0.1, "m1,1 2,0 1,3"),
         # why a multiple that divides evenly into 1 is a good idea
         ("m1,1 2,0 1,3", 0.128, "m1.024,1.024 2.048,0 1.024,2.944"),
+        # arc flags are left alone
+        ("M0,0 A1,1 0 1 1 5,5", 0.128, "M0,0 A1.024 1.024 0 1 1 4.992,4.992"),
     ],
 )
 def test_round_multiple(path: str, multiple_of: float, expected_result: str):
     actual = SVGPath(d=path).round_multiple(multiple_of, inplace=True).d
-    print(f"A: {actual}")
-    print(f"E: {expected_result}")
-    assert actual == expected_result
+    assert actual == expected_result, f"A: {actual}\nE: {expected_result}"
 
 
 @pytest.mark.parametrize(
@@ -511,9 +501,7 @@ def test_remove_empty_subpaths(path: str, expected_result: str):
         .round_floats(3, inplace=True)
         .d
     )
-    print(f"A: {actual}")
-    print(f"E: {expected_result}")
-    assert actual == expected_result
+    assert actual == expected_result, f"A: {actual}\nE: {expected_result}"
 
 
 def test_rect():